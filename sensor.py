@@ -12,12 +12,15 @@ Author: BME680 Monitor Project
 Version: 2.1.0
 """
 
+import atexit
 import time
 import logging
 import sys
 import os
 from pathlib import Path
 
+from smbus2 import SMBus
+
 # ===== CONFIGURATION CONSTANTS =====
 # Adjust these values to customize logging behavior
 LOG_INTERVAL_MINUTES = 15  # Write to sensor.log every N minutes
@@ -112,12 +115,22 @@ def main():
     logger.info(f"Log interval: Every {LOG_INTERVAL_MINUTES} minutes")
     logger.info(f"CSV logging: Every reading (~{config.sampling_interval}s)")
 
+    # Open the I2C bus once and share it between the sensor and the display.
+    # Closed at exit after the display's own cleanup hooks, which still use it.
+    try:
+        i2c_bus = SMBus(1)
+    except OSError as e:
+        logger.error(f"Failed to open I2C bus: {e}")
+        sys.exit(1)
+    atexit.register(i2c_bus.close)
+
     # Initialize sensor
     try:
         sensor_manager = SensorManager(
             i2c_address=config.sensor_i2c_address,
             gas_heater_temperature=config.gas_heater_temperature,
-            gas_heater_duration=config.gas_heater_duration
+            gas_heater_duration=config.gas_heater_duration,
+            bus=i2c_bus
         )
     except RuntimeError:
         logger.error("Failed to initialize sensor. Exiting.")
@@ -149,7 +162,9 @@ def main():
         font_name=config.oled_font_name,
         font_size=config.oled_font_size,
         line_height=config.oled_line_height,
-        title=config.oled_title
+        title=config.oled_title,
+        update_interval=config.sampling_interval,
+        bus=i2c_bus
     )
 
     # Initialize data logger
@@ -280,8 +295,7 @@ def main():
 
     finally:
         # Cleanup
-        if display.is_available():
-            display.clear()
+        display.close()
         logger.info("Shutdown complete.")
 
 
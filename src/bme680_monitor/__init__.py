@@ -18,6 +18,7 @@ from .air_quality import AirQualityCalculator
 from .display import OLEDDisplay
 from .data_logger import DataLogger
 from .comfort_index import ComfortIndexCalculator
+from .classify import classify_temperature, classify_humidity, classify_pressure
 
 __all__ = [
     "Config",
@@ -26,4 +27,7 @@ __all__ = [
     "OLEDDisplay",
     "DataLogger",
     "ComfortIndexCalculator",
+    "classify_temperature",
+    "classify_humidity",
+    "classify_pressure",
 ]
@@ -0,0 +1,123 @@
+"""
+Classification of readings into the comfort label levels shown on the OLED.
+
+Missing readings (NaN) get level 0.
+"""
+
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache, partial
+from typing import Iterable, Tuple
+
+
+# Label boundaries for bisect_right: a value equal to an edge gets the upper
+# level, so upper-inclusive ranges (e.g. Perfect up to and including 24 °C) are
+# nudged by _EDGE_EPS, which also absorbs float error from quantization
+_EDGE_EPS = 1e-6
+TEMP_EDGES = (10, 18, 24 + _EDGE_EPS, 28 + _EDGE_EPS)
+HUMID_EDGES = (30, 40, 60 + _EDGE_EPS, 70 + _EDGE_EPS)
+PRESSURE_EDGES = (980, 1000, 1025 + _EDGE_EPS, 1035 + _EDGE_EPS)
+
+
+def _classify_kernel(values, edges, out):
+    """Write the level of each value in values to out (compiled by numba)."""
+    for i in range(values.shape[0]):
+        value = values[i]
+        # NaN gets level 0, the same as in _level
+        if value != value:
+            out[i] = 0
+            continue
+        level = 0
+        while level < edges.shape[0] and edges[level] <= value:
+            level += 1
+        out[i] = level
+
+
+def _level(edges: Tuple[float, ...], value: float) -> int:
+    """Return the level of a single value; NaN (a missing reading) gets level 0."""
+    # NaN compares false against every edge, so bisect_right alone would put
+    # it above the top edge
+    if value != value:
+        return 0
+    return bisect_right(edges, value)
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    Compile _classify_kernel on first use.
+
+    numba is imported here rather than at module level so that importing this
+    module (and the OLED display, which shares its edges) stays cheap.
+
+    Returns:
+        The njit-compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    return njit(cache=True)(_classify_kernel)
+
+
+def _classify(values, edges: Tuple[float, ...]):
+    """Return the level of each value, using the compiled kernel for NumPy input."""
+    # A NumPy array can only be passed in if NumPy is already imported
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(values, np.ndarray):
+        kernel = _numba_kernel()
+        if kernel is not None:
+            out = np.empty(values.shape[0], dtype=np.int8)
+            kernel(
+                np.asarray(values, dtype=np.float64), np.asarray(edges, dtype=np.float64), out
+            )
+            return out
+
+    return array('b', map(partial(_level, edges), values))
+
+
+def classify_temperature(values: Iterable[float]):
+    """
+    Classify temperatures into label levels (0 = Very Cold ... 4 = Very Hot).
+
+    Args:
+        values: Temperatures in Celsius; a 1-D NumPy array uses the compiled
+            kernel when numba is installed
+
+    Returns:
+        int8 NumPy array for NumPy input when numba is installed, otherwise
+        array('b') of levels
+    """
+    return _classify(values, TEMP_EDGES)
+
+
+def classify_humidity(values: Iterable[float]):
+    """
+    Classify relative humidities into label levels (0 = Very Dry ... 4 = Very Humid).
+
+    Args:
+        values: Relative humidities in %; a 1-D NumPy array uses the compiled
+            kernel when numba is installed
+
+    Returns:
+        int8 NumPy array for NumPy input when numba is installed, otherwise
+        array('b') of levels
+    """
+    return _classify(values, HUMID_EDGES)
+
+
+def classify_pressure(values: Iterable[float]):
+    """
+    Classify pressures into label levels (0 = Storm ... 4 = Very Dry).
+
+    Args:
+        values: Atmospheric pressures in hPa; a 1-D NumPy array uses the
+            compiled kernel when numba is installed
+
+    Returns:
+        int8 NumPy array for NumPy input when numba is installed, otherwise
+        array('b') of levels
+    """
+    return _classify(values, PRESSURE_EDGES)
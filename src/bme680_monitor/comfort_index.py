@@ -7,6 +7,11 @@ from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
+# Celsius/Fahrenheit conversion constants
+_C_TO_F_SCALE = 9 / 5
+_F_TO_C_SCALE = 5 / 9
+_F_OFFSET = 32.0
+
 
 class HumidityLevel(IntEnum):
     """Humidity comfort levels."""
@@ -35,6 +40,11 @@ class ComfortLevel(IntEnum):
     VERY_COMFORTABLE = 4
 
 
+# Comfort score contribution per level, indexed by the IntEnum value
+_HUMIDITY_SCORES = (0, 1, 2, 1, 0)  # VERY_DRY, DRY, OPTIMAL, HUMID, VERY_HUMID
+_PRESSURE_SCORES = (0, 0, 1, 0, 0)  # only NORMAL pressure scores
+
+
 class ComfortIndexCalculator:
     """
     Calculate comfort indices and environmental interpretations.
@@ -219,17 +229,22 @@ class ComfortIndexCalculator:
             return (temperature, "No aplica (temperatura baja)")
 
         # Convert to Fahrenheit for calculation
-        T_f = temperature * 9/5 + 32
+        T_f = temperature * _C_TO_F_SCALE + _F_OFFSET
         RH = humidity
 
-        # Rothfusz regression (simplified)
-        HI_f = -42.379 + 2.04901523 * T_f + 10.14333127 * RH
-        HI_f -= 0.22475541 * T_f * RH - 0.00683783 * T_f * T_f
-        HI_f -= 0.05481717 * RH * RH + 0.00122874 * T_f * T_f * RH
-        HI_f += 0.00085282 * T_f * RH * RH - 0.00000199 * T_f * T_f * RH * RH
+        # Rothfusz regression with shared products computed once
+        Tf2 = T_f * T_f
+        RH2 = RH * RH
+        TfRH = T_f * RH
+        HI_f = (
+            -42.379 + 2.04901523 * T_f + 10.14333127 * RH
+            - 0.22475541 * TfRH - 0.00683783 * Tf2 - 0.05481717 * RH2
+            + 0.00122874 * Tf2 * RH + 0.00085282 * T_f * RH2
+            - 0.00000199 * Tf2 * RH2
+        )
 
         # Convert back to Celsius
-        HI_c = (HI_f - 32) * 5/9
+        HI_c = (HI_f - _F_OFFSET) * _F_TO_C_SCALE
 
         # Interpretation
         if HI_c < 27:
@@ -247,7 +262,9 @@ class ComfortIndexCalculator:
         self,
         temperature: float,
         humidity: float,
-        pressure: float
+        pressure: float,
+        humid_level: Optional[HumidityLevel] = None,
+        press_level: Optional[PressureLevel] = None
     ) -> Tuple[ComfortLevel, str, str]:
         """
         Assess overall environmental comfort.
@@ -256,13 +273,17 @@ class ComfortIndexCalculator:
             temperature: Temperature in °C
             humidity: Relative humidity in %
             pressure: Atmospheric pressure in hPa
+            humid_level: Precomputed humidity level (assessed from humidity if None)
+            press_level: Precomputed pressure level (assessed from pressure if None)
 
         Returns:
             Tuple of (comfort_level, summary, recommendation)
         """
-        # Assess each component
-        humid_level, _, _ = self.assess_humidity(humidity)
-        press_level, _, _ = self.assess_pressure(pressure)
+        # Assess each component unless the caller already did
+        if humid_level is None:
+            humid_level, _, _ = self.assess_humidity(humidity)
+        if press_level is None:
+            press_level, _, _ = self.assess_pressure(pressure)
 
         # Temperature score
         if self.comfort_temp_min <= temperature <= self.comfort_temp_max:
@@ -272,16 +293,11 @@ class ComfortIndexCalculator:
         else:
             temp_score = 1  # Acceptable
 
-        # Humidity score
-        if humid_level == HumidityLevel.OPTIMAL:
-            humid_score = 2
-        elif humid_level in (HumidityLevel.DRY, HumidityLevel.HUMID):
-            humid_score = 1
-        else:
-            humid_score = 0
+        # Humidity score (lookup indexed by HumidityLevel value)
+        humid_score = _HUMIDITY_SCORES[humid_level]
 
         # Pressure doesn't affect comfort as much, just weather
-        press_score = 1 if press_level == PressureLevel.NORMAL else 0
+        press_score = _PRESSURE_SCORES[press_level]
 
         # Calculate overall comfort
         total_score = temp_score + humid_score + press_score
@@ -331,7 +347,7 @@ class ComfortIndexCalculator:
         temp_label, temp_rec = self.assess_temperature(temperature)
         heat_index, heat_interp = self.calculate_heat_index(temperature, humidity)
         comfort_level, comfort_summary, comfort_rec = self.assess_overall_comfort(
-            temperature, humidity, pressure
+            temperature, humidity, pressure, humid_level, press_level
         )
 
         return {
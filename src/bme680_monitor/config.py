@@ -2,7 +2,7 @@
 
 import os
 import yaml
-from typing import Any, Dict
+from typing import IO, Any, Dict, Tuple
 from pathlib import Path
 
 
@@ -11,6 +11,58 @@ class Config:
 
     DEFAULT_CONFIG_FILE = "config.yaml"
 
+    # Attribute name -> (dot-notation key path, default value)
+    _SCHEMA: Dict[str, Tuple[str, Any]] = {
+        # Sensor configuration
+        'sensor_i2c_address': ('sensor.i2c_address', 0x77),
+        'gas_heater_temperature': ('sensor.gas_heater_temperature', 320),
+        'gas_heater_duration': ('sensor.gas_heater_duration', 150),
+        'sampling_interval': ('sensor.sampling_interval', 1),
+
+        # Calibration configuration
+        'burn_in_duration': ('calibration.burn_in_duration', 300),
+        'baseline_sampling_duration': ('calibration.baseline_sampling_duration', 300),
+        'recalibration_interval': ('calibration.recalibration_interval', 14400),
+        'baseline_file': ('calibration.baseline_file', 'gas_baseline.json'),
+        'baseline_max_age': ('calibration.baseline_max_age', 24),
+
+        # Air quality configuration (relative ratios and absolute Ohms)
+        'good_air_threshold': ('air_quality.good_threshold', 1.35),
+        'poor_air_threshold': ('air_quality.poor_threshold', 0.70),
+        'excellent_threshold_abs': ('air_quality.excellent_threshold', 150000),
+        'good_threshold_abs': ('air_quality.good_threshold_abs', 100000),
+        'moderate_threshold_abs': ('air_quality.moderate_threshold', 50000),
+        'clean_air_min': ('air_quality.clean_air_min', 50000),
+        'clean_air_max': ('air_quality.clean_air_max', 200000),
+
+        # OLED configuration
+        'oled_enabled': ('oled.enabled', True),
+        'oled_i2c_address': ('oled.i2c_address', 0x3C),
+        'oled_width': ('oled.width', 128),
+        'oled_height': ('oled.height', 64),
+        'oled_yellow_section_height': ('oled.yellow_section_height', 16),
+        'oled_font_name': ('oled.font_name', 'DejaVuSans.ttf'),
+        'oled_font_size': ('oled.font_size', 10),
+        'oled_line_height': ('oled.line_height', 12),
+        'oled_title': ('oled.title', 'BME680 Readings'),
+
+        # Data logging configuration
+        'csv_filename': ('data_logging.csv_filename', 'measures.csv'),
+        'flush_immediately': ('data_logging.flush_immediately', True),
+
+        # Logging configuration
+        'log_level': ('logging.level', 'INFO'),
+        'log_format': (
+            'logging.format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ),
+        'log_date_format': ('logging.date_format', '%Y-%m-%d %H:%M:%S'),
+        'log_file_enabled': ('logging.file.enabled', True),
+        'log_filename': ('logging.file.filename', 'logs/sensor.log'),
+        'log_max_bytes': ('logging.file.max_bytes', 10485760),
+        'log_backup_count': ('logging.file.backup_count', 5),
+        'log_console_enabled': ('logging.console.enabled', True),
+    }
+
     def __init__(self, config_file: str = None):
         """
         Initialize configuration.
@@ -22,6 +74,23 @@ class Config:
         self._config: Dict[str, Any] = {}
         self.load()
 
+    @classmethod
+    def from_stream(cls, stream: IO[str]) -> "Config":
+        """
+        Create a configuration from an open YAML text stream.
+
+        Args:
+            stream: Readable text stream (e.g. an open file or io.StringIO)
+
+        Returns:
+            Config populated from the stream contents
+        """
+        config = cls.__new__(cls)
+        config.config_file = getattr(stream, 'name', '<stream>')
+        config._config = {}
+        config._load_stream(stream)
+        return config
+
     def load(self) -> None:
         """Load configuration from YAML file."""
         if not os.path.exists(self.config_file):
@@ -31,7 +100,15 @@ class Config:
             )
 
         with open(self.config_file, 'r') as f:
-            self._config = yaml.safe_load(f)
+            self._load_stream(f)
+
+    def _load_stream(self, stream: IO[str]) -> None:
+        """Parse YAML from stream and replace the loaded configuration."""
+        self._config = yaml.safe_load(stream)
+
+        # Drop values cached by __getattr__ so they are re-read from the new data
+        for name in self._SCHEMA:
+            self.__dict__.pop(name, None)
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -60,186 +137,32 @@ class Config:
 
         return value
 
-    # Sensor configuration
-    @property
-    def sensor_i2c_address(self) -> int:
-        """Get sensor I2C address."""
-        return self.get('sensor.i2c_address', 0x77)
-
-    @property
-    def gas_heater_temperature(self) -> int:
-        """Get gas heater temperature in Celsius."""
-        return self.get('sensor.gas_heater_temperature', 320)
-
-    @property
-    def gas_heater_duration(self) -> int:
-        """Get gas heater duration in milliseconds."""
-        return self.get('sensor.gas_heater_duration', 150)
-
-    @property
-    def sampling_interval(self) -> int:
-        """Get sampling interval in seconds."""
-        return self.get('sensor.sampling_interval', 1)
-
-    # Calibration configuration
-    @property
-    def burn_in_duration(self) -> int:
-        """Get burn-in duration in seconds."""
-        return self.get('calibration.burn_in_duration', 300)
-
-    @property
-    def baseline_sampling_duration(self) -> int:
-        """Get baseline sampling duration in seconds."""
-        return self.get('calibration.baseline_sampling_duration', 300)
-
-    @property
-    def recalibration_interval(self) -> int:
-        """Get recalibration interval in seconds (0 = disabled)."""
-        return self.get('calibration.recalibration_interval', 14400)
-
-    @property
-    def baseline_file(self) -> str:
-        """Get baseline persistence file path."""
-        return self.get('calibration.baseline_file', 'gas_baseline.json')
-
-    @property
-    def baseline_max_age(self) -> int:
-        """Get baseline maximum age in hours."""
-        return self.get('calibration.baseline_max_age', 24)
-
-    # Air quality configuration
-    @property
-    def good_air_threshold(self) -> float:
-        """Get good air quality threshold ratio (relative)."""
-        return self.get('air_quality.good_threshold', 1.35)
-
-    @property
-    def poor_air_threshold(self) -> float:
-        """Get poor air quality threshold ratio (relative)."""
-        return self.get('air_quality.poor_threshold', 0.70)
-
-    @property
-    def excellent_threshold_abs(self) -> int:
-        """Get excellent air quality threshold in Ohms (absolute)."""
-        return self.get('air_quality.excellent_threshold', 150000)
-
-    @property
-    def good_threshold_abs(self) -> int:
-        """Get good air quality threshold in Ohms (absolute)."""
-        return self.get('air_quality.good_threshold_abs', 100000)
-
-    @property
-    def moderate_threshold_abs(self) -> int:
-        """Get moderate air quality threshold in Ohms (absolute)."""
-        return self.get('air_quality.moderate_threshold', 50000)
-
-    @property
-    def clean_air_min(self) -> int:
-        """Get minimum clean air resistance in Ohms."""
-        return self.get('air_quality.clean_air_min', 50000)
-
-    @property
-    def clean_air_max(self) -> int:
-        """Get maximum clean air resistance in Ohms."""
-        return self.get('air_quality.clean_air_max', 200000)
-
-    # OLED configuration
-    @property
-    def oled_enabled(self) -> bool:
-        """Check if OLED display is enabled."""
-        return self.get('oled.enabled', True)
-
-    @property
-    def oled_i2c_address(self) -> int:
-        """Get OLED I2C address."""
-        return self.get('oled.i2c_address', 0x3C)
-
-    @property
-    def oled_width(self) -> int:
-        """Get OLED display width."""
-        return self.get('oled.width', 128)
-
-    @property
-    def oled_height(self) -> int:
-        """Get OLED display height."""
-        return self.get('oled.height', 64)
-
-    @property
-    def oled_yellow_section_height(self) -> int:
-        """Get OLED yellow section height."""
-        return self.get('oled.yellow_section_height', 16)
-
-    @property
-    def oled_font_name(self) -> str:
-        """Get OLED font name."""
-        return self.get('oled.font_name', 'DejaVuSans.ttf')
-
-    @property
-    def oled_font_size(self) -> int:
-        """Get OLED font size."""
-        return self.get('oled.font_size', 10)
-
-    @property
-    def oled_line_height(self) -> int:
-        """Get OLED line height."""
-        return self.get('oled.line_height', 12)
-
-    @property
-    def oled_title(self) -> str:
-        """Get OLED display title."""
-        return self.get('oled.title', 'BME680 Readings')
-
-    # Data logging configuration
-    @property
-    def csv_filename(self) -> str:
-        """Get CSV output filename."""
-        return self.get('data_logging.csv_filename', 'measures.csv')
-
-    @property
-    def flush_immediately(self) -> bool:
-        """Check if CSV should flush immediately after each write."""
-        return self.get('data_logging.flush_immediately', True)
-
-    # Logging configuration
-    @property
-    def log_level(self) -> str:
-        """Get logging level."""
-        return self.get('logging.level', 'INFO')
-
-    @property
-    def log_format(self) -> str:
-        """Get logging format."""
-        return self.get('logging.format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-    @property
-    def log_date_format(self) -> str:
-        """Get logging date format."""
-        return self.get('logging.date_format', '%Y-%m-%d %H:%M:%S')
-
-    @property
-    def log_file_enabled(self) -> bool:
-        """Check if file logging is enabled."""
-        return self.get('logging.file.enabled', True)
-
-    @property
-    def log_filename(self) -> str:
-        """Get log file path."""
-        return self.get('logging.file.filename', 'logs/sensor.log')
-
-    @property
-    def log_max_bytes(self) -> int:
-        """Get maximum log file size in bytes."""
-        return self.get('logging.file.max_bytes', 10485760)
-
-    @property
-    def log_backup_count(self) -> int:
-        """Get number of log file backups to keep."""
-        return self.get('logging.file.backup_count', 5)
-
-    @property
-    def log_console_enabled(self) -> bool:
-        """Check if console logging is enabled."""
-        return self.get('logging.console.enabled', True)
+    def __getattr__(self, name: str) -> Any:
+        """
+        Resolve a schema attribute on first access and cache it.
+
+        Only called when normal lookup fails, so after the first read the
+        value is served straight from the instance dictionary.
+
+        Args:
+            name: Attribute name declared in _SCHEMA
+
+        Returns:
+            Configuration value or its schema default
+
+        Raises:
+            AttributeError: If name is not a known configuration attribute
+        """
+        try:
+            key_path, default = self._SCHEMA[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+        value = self.get(key_path, default)
+        self.__dict__[name] = value
+        return value
 
     def __repr__(self) -> str:
         """String representation of config."""
@@ -83,10 +83,10 @@ class DataLogger:
 
         row = [
             timestamp_str,
-            round(temperature, 2),
-            round(humidity, 2),
-            round(pressure, 2),
-            round(gas_resistance, 2) if gas_resistance is not None else None,
+            f"{temperature:.2f}",
+            f"{humidity:.2f}",
+            f"{pressure:.2f}",
+            "" if gas_resistance is None else f"{gas_resistance:.2f}",
             air_quality_index,
             air_quality_label
         ]
@@ -109,26 +109,26 @@ class DataLogger:
         Args:
             readings: List of dictionaries containing sensor readings
         """
+        # Readings without their own timestamp share the time of the flush
+        now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
         try:
-            with open(self.filename, 'a', newline='') as f:
-                writer = csv.writer(f)
+            # Format every row up front so the file is written in one writerows call
+            rows = [
+                (
+                    reading.get('timestamp', now_str),
+                    f"{reading['temperature']:.2f}",
+                    f"{reading['humidity']:.2f}",
+                    f"{reading['pressure']:.2f}",
+                    f"{reading['gas_resistance']:.2f}" if reading.get('gas_resistance') else "",
+                    reading.get('air_quality_index'),
+                    reading.get('air_quality_label', 'Unknown')
+                )
+                for reading in readings
+            ]
 
-                for reading in readings:
-                    timestamp_str = reading.get(
-                        'timestamp',
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    )
-
-                    row = [
-                        timestamp_str,
-                        round(reading['temperature'], 2),
-                        round(reading['humidity'], 2),
-                        round(reading['pressure'], 2),
-                        round(reading['gas_resistance'], 2) if reading.get('gas_resistance') else None,
-                        reading.get('air_quality_index'),
-                        reading.get('air_quality_label', 'Unknown')
-                    ]
-                    writer.writerow(row)
+            with open(self.filename, 'a', newline='') as f:
+                csv.writer(f).writerows(rows)
 
                 if self.flush_immediately:
                     f.flush()
@@ -145,9 +145,10 @@ class DataLogger:
         Returns:
             File size in bytes, or 0 if file doesn't exist
         """
-        if os.path.exists(self.filename):
-            return os.path.getsize(self.filename)
-        return 0
+        try:
+            return os.stat(self.filename).st_size
+        except FileNotFoundError:
+            return 0
 
     def get_file_size_mb(self) -> float:
         """
@@ -1,20 +1,145 @@
 """OLED display management for BME680 sensor readings."""
 
+from __future__ import annotations
+
+import atexit
+import functools
 import logging
+import queue
+import re
+import threading
 import time
-from typing import Optional
-from luma.core.interface.serial import i2c
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
-from PIL import ImageFont
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+from .classify import HUMID_EDGES, PRESSURE_EDGES, TEMP_EDGES
+
+if TYPE_CHECKING:
+    from luma.oled.device import ssd1306
+    from smbus2 import SMBus
 
 
 logger = logging.getLogger(__name__)
 
+# SSD1306 addressing commands used for partial framebuffer updates
+_SET_COLUMN_ADDRESS = 0x21
+_SET_PAGE_ADDRESS = 0x22
+
+# Short interpretation labels shown in the normal view, indexed by the levels
+# that bisect_right over the classify edges yields (coldest/driest/lowest first)
+_TEMP_LABELS = ("Very Cold", "Cold", "Perfect", "Warm", "Very Hot")
+_HUMID_LABELS = ("Very Dry", "Dry", "Ideal", "Humid", "Very Humid")
+_PRESSURE_LABELS = ("Storm", "Rainy", "Normal", "Clear", "Very Dry")
+
+# Emoji and symbols used in comfort recommendations, stripped in a single pass.
+# Several are followed by the U+FE0F variation selector, which is listed on its own.
+_EMOJI_RE = re.compile("[✓⚠❌🥶❄🌡🔥💧💨☁⛅☀🌧🌤\uFE0F]")
+
+# Characters that make up the numeric values, rendered once as a glyph atlas
+_ATLAS_CHARS = "0123456789.,:%- ()khPaCRH"
+
+# Comfort view (emoji, English text), indexed by ComfortLevel value
+_COMFORT_TABLE = (
+    ('😫', 'Poor'),           # Very Uncomfortable
+    ('😟', 'Uncomfortable'),  # Uncomfortable
+    ('😐', 'Acceptable'),     # Acceptable
+    ('🙂', 'Good'),           # Comfortable
+    ('😊', 'Excellent'),      # Very Comfortable
+)
+_COMFORT_UNKNOWN = ('❓', 'Unknown')
+
+# Fixed strings drawn with the regular font, rasterized once at start-up
+_STATIC_TEXTS = (
+    ("Confort", _COMFORT_UNKNOWN[1])
+    + tuple(text for _, text in _COMFORT_TABLE)
+    + tuple(f"T: {label} " for label in _TEMP_LABELS)
+    + tuple(f"H: {label} " for label in _HUMID_LABELS)
+    + tuple(f"P: {label} " for label in _PRESSURE_LABELS)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_gas_kohm(gas_k: int) -> str:
+    """Format the gas resistance suffix of the AQ line for a whole kOhm value."""
+    return f" ({gas_k}k)"
+
+
+@functools.lru_cache(maxsize=None)
+def _bulk_i2c_class() -> type:
+    """
+    Build the luma I2C interface used with a caller-provided bus.
+
+    Given a bus object, luma's i2c interface falls back to 32-byte SMBus
+    block writes. The SSD1306 accepts arbitrarily long writes, so this
+    subclass sends each data buffer in one smbus2 i2c_rdwr transfer, as luma
+    does when it owns the bus.
+
+    Commands go through i2c_rdwr too. The bus is shared with the sensor, which
+    the main thread drives through SMBus calls that depend on the file
+    descriptor's cached I2C_SLAVE address; i2c_rdwr messages carry their own
+    address and never change it, so writer-thread transfers to the display
+    cannot redirect a concurrent sensor transfer (or vice versa).
+
+    Created on first use so luma is only imported when a display is actually
+    initialized.
+    """
+    import errno
+
+    from luma.core.error import DeviceNotFoundError
+    from luma.core.interface.serial import i2c
+    from smbus2 import i2c_msg
+
+    class _BulkI2C(i2c):
+        # Largest payload luma's own i2c_rdwr path sends per transfer
+        _BLOCK_SIZE = 4096
+
+        def __init__(self, bus: SMBus, address: int):
+            super().__init__(bus=bus, address=address)
+            self._i2c_msg_write = i2c_msg.write
+
+        def command(self, *cmd: int) -> None:
+            assert len(cmd) <= 32
+
+            try:
+                self._bus.i2c_rdwr(self._i2c_msg_write(self._addr, [self._cmd_mode] + list(cmd)))
+            except OSError as e:
+                if e.errno in (errno.EREMOTEIO, errno.EIO):
+                    raise DeviceNotFoundError(
+                        f"I2C device not found on address: 0x{self._addr:02X}"
+                    ) from e
+                raise
+
+        def data(self, data) -> None:
+            for i in range(0, len(data), self._BLOCK_SIZE):
+                self._write_large_block(list(data[i:i + self._BLOCK_SIZE]))
+
+    return _BulkI2C
+
 
 class OLEDDisplay:
     """Manages OLED display output for sensor readings."""
 
+    __slots__ = (
+        'enabled', 'i2c_port', 'i2c_address', 'width', 'height', 'yellow_section_height',
+        'font_size', 'line_height', 'title', '_bus',
+        'device', 'font', '_large_font', '_comfort_layout', '_label_bitmaps', '_glyph_cache',
+        '_text_cache', '_pages', '_page_buffers', '_flush_queue', '_writer', '_closed',
+        '_frame_a', '_frame_b', '_frame_a_key', '_frame_b_key', '_message_frame', '_title_y',
+        '_last_state_key', '_resend_needed',
+        '_tick', '_show_comfort_view', '_normal_view_ticks', '_comfort_view_ticks',
+    )
+
+    # Maximum number of rendered text bitmaps kept in the LRU cache
+    _TEXT_CACHE_SIZE = 128
+
+    # Display resolution of each reading; values are snapped to these steps so
+    # sensor jitter below the visible precision produces identical frames
+    _T_STEP = 0.2  # °C
+    _H_STEP = 1    # %RH
+    _P_STEP = 1    # hPa
+
     def __init__(
         self,
         enabled: bool = True,
@@ -26,7 +151,9 @@ class OLEDDisplay:
         font_name: str = "DejaVuSans.ttf",
         font_size: int = 10,
         line_height: int = 12,
-        title: str = "BME680 Readings"
+        title: str = "BME680 Readings",
+        update_interval: float = 1.0,
+        bus: Optional[SMBus] = None
     ):
         """
         Initialize OLED display.
@@ -42,6 +169,10 @@ class OLEDDisplay:
             font_size: Font size in points
             line_height: Line height in pixels
             title: Display title text
+            update_interval: Expected seconds between update() calls, used to
+                time the alternation between the readings and comfort views
+            bus: Open I2C bus to share with other devices; if None luma opens
+                its own on i2c_port
         """
         self.enabled = enabled
         self.i2c_port = i2c_port
@@ -52,24 +183,91 @@ class OLEDDisplay:
         self.font_size = font_size
         self.line_height = line_height
         self.title = title
+        self._bus = bus
 
         self.device: Optional[ssd1306] = None
         self.font: Optional[ImageFont.FreeTypeFont] = None
+        self._large_font: Optional[ImageFont.FreeTypeFont] = None
+
+        # Comfort view layout per comfort level:
+        # (emoji x, emoji bitmap, text x, text bitmap), built once by _initialize
+        self._comfort_layout: Dict[int, Tuple[int, Image.Image, int, Image.Image]] = {}
+
+        # Bitmaps and advance widths of fixed strings in the regular font,
+        # built once by _initialize
+        self._label_bitmaps: Dict[str, Tuple[Image.Image, int]] = {}
+
+        # Glyph bitmaps and advance widths for _ATLAS_CHARS in the regular font
+        self._glyph_cache: Dict[str, Tuple[Image.Image, int]] = {}
+
+        # Rendered text bitmaps keyed by (font id, text), least recently used first
+        self._text_cache: "OrderedDict[Tuple[int, str], Image.Image]" = OrderedDict()
+
+        # Last bytes sent for each 8-pixel-high framebuffer page (None = unknown)
+        self._pages = height // 8
+        self._page_buffers: List[Optional[bytes]] = [None] * self._pages
+
+        # Frames waiting to be sent by the background writer thread; only the
+        # latest one matters, so the queue holds a single frame (None stops it)
+        self._flush_queue: "queue.Queue[Optional[Image.Image]]" = queue.Queue(maxsize=1)
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        # Pre-rendered readings (A) and comfort (B) frames and the keys they were
+        # rendered for; both are created by _initialize
+        self._frame_a: Optional[Image.Image] = None
+        self._frame_b: Optional[Image.Image] = None
+        self._frame_a_key: Optional[tuple] = None
+        self._frame_b_key: Optional[tuple] = None
+
+        # Persistent frame reused by show_message()
+        self._message_frame: Optional[Image.Image] = None
+        self._title_y = 0
+
+        # State key of the frame currently shown (None forces a redraw)
+        self._last_state_key: Optional[tuple] = None
 
-        # Display alternation state
-        self._last_switch_time = time.time()
+        # Set by the writer thread when a flush failed; update() then resends
+        # even if the state key is unchanged
+        self._resend_needed = False
+
+        # Display alternation state, counted in update() calls rather than
+        # wall-clock time since the caller drives updates at a fixed cadence
+        self._tick = 0
         self._show_comfort_view = False
-        self._normal_view_duration = 5.0  # Show normal view for 5 seconds
-        self._comfort_view_duration = 3.0  # Show comfort view for 3 seconds
+        self._normal_view_ticks = max(1, round(5.0 / update_interval))  # ~5 seconds
+        self._comfort_view_ticks = max(1, round(3.0 / update_interval))  # ~3 seconds
 
         if self.enabled:
             self._initialize()
 
     def _initialize(self) -> None:
         """Initialize OLED device and font."""
+        # Hardware libraries are imported here so the package can be imported
+        # (e.g. by tests) without them
+        try:
+            from luma.core.error import Error as LumaError
+            from luma.core.interface.serial import i2c
+            from luma.oled.device import ssd1306
+        except ImportError as e:
+            logger.error("OLED libraries not available: %s", e)
+            self.enabled = False
+            return
+
         try:
-            serial = i2c(port=self.i2c_port, address=self.i2c_address)
-            self.device = ssd1306(serial)
+            # Either way each framebuffer write is a single smbus2 i2c_rdwr call
+            # rather than a series of 32-byte SMBus block writes
+            if self._bus is not None:
+                # Share the caller's bus so the process holds one /dev/i2c handle
+                serial = _bulk_i2c_class()(self._bus, self.i2c_address)
+            else:
+                serial = i2c(port=self.i2c_port, address=self.i2c_address)
+            self.device = ssd1306(serial, width=self.width, height=self.height)
+
+            # Frames, bitmaps and the page packing in _flush are all 1-bit
+            if self.device.mode != "1":
+                raise ValueError(f"Unsupported OLED image mode: {self.device.mode}")
+
             logger.info("OLED display initialized successfully")
 
             # Try to load TrueType font
@@ -78,14 +276,60 @@ class OLEDDisplay:
                     "DejaVuSans.ttf",
                     self.font_size
                 )
+                # Larger face for the comfort view emoji
+                self._large_font = ImageFont.truetype("DejaVuSans.ttf", 28)
                 logger.info("Using DejaVuSans.ttf font for OLED")
             except IOError:
                 self.font = ImageFont.load_default()
+                self._large_font = self.font
                 self.line_height = 10  # Adjust for default font
                 logger.warning("DejaVuSans.ttf not found, using default PIL font")
 
-        except Exception as e:
-            logger.error(f"Error initializing OLED display: {e}")
+            self._frame_a = Image.new("1", self.device.size)
+            self._frame_b = Image.new("1", self.device.size)
+            self._message_frame = Image.new("1", self.device.size)
+            self._title_y = max(0, (self.yellow_section_height - self.line_height) // 2)
+
+            # Rasterize the title and other fixed strings up front
+            self._label_bitmaps = {
+                text: (
+                    self._render_text(text, self.font),
+                    round(self.font.getlength(text, mode="1")),
+                )
+                for text in (self.title,) + _STATIC_TEXTS
+            }
+            self._glyph_cache = {
+                char: (
+                    self._render_text(char, self.font),
+                    round(self.font.getlength(char, mode="1")),
+                )
+                for char in _ATLAS_CHARS
+            }
+
+            # The comfort view has one fixed layout per level, so center and
+            # rasterize its emoji and text up front
+            self._comfort_layout = {
+                level: (
+                    self._centered_x(emoji, self._large_font),
+                    self._render_text(emoji, self._large_font),
+                    self._centered_x(text, self.font),
+                    self._render_text(text, self.font),
+                )
+                for level, (emoji, text) in enumerate(_COMFORT_TABLE)
+            }
+
+            # I2C transfers run on a writer thread so callers never block on the bus
+            self._writer = threading.Thread(
+                target=self._flush_loop, name="oled-writer", daemon=True
+            )
+            self._writer.start()
+
+            # Blank the screen and stop the writer before luma's own exit hook
+            # (registered earlier, so it runs later) closes the bus
+            atexit.register(self.close)
+
+        except (OSError, ValueError, LumaError) as e:
+            logger.error("Error initializing OLED display: %s", e)
             logger.info("OLED display will not be used. Check I2C connection and address.")
             self.device = None
             self.enabled = False
@@ -115,171 +359,427 @@ class OLEDDisplay:
         if not self.enabled or not self.device or not self.font:
             return
 
+        frame_a, frame_b = self._frame_a, self._frame_b
+        if frame_a is None or frame_b is None:
+            return
+
         # Check if it's time to switch views (asymmetric timing)
-        current_time = time.time()
-        time_since_switch = current_time - self._last_switch_time
+        self._tick += 1
 
         # Use different durations depending on current view
         if self._show_comfort_view:
-            switch_threshold = self._comfort_view_duration
+            switch_ticks = self._comfort_view_ticks
         else:
-            switch_threshold = self._normal_view_duration
+            switch_ticks = self._normal_view_ticks
 
-        if time_since_switch >= switch_threshold:
+        if self._tick >= switch_ticks:
             self._show_comfort_view = not self._show_comfort_view
-            self._last_switch_time = current_time
+            self._tick = 0
+
+        # Snap readings to the displayed precision
+        temperature = self._quantize(temperature, self._T_STEP)
+        humidity = self._quantize(humidity, self._H_STEP)
+        pressure = self._quantize(pressure, self._P_STEP)
+
+        aq_text = self._format_air_quality(air_quality_label, gas_resistance, air_quality_index)
+
+        # Keys describing what each view would show; a view is only re-rendered
+        # when its own key changes
+        readings_key = ('normal' if comfort_report else 'fallback',
+                        temperature, humidity, pressure, aq_text)
+        comfort_key = ('comfort', comfort_report['overall_comfort']['level']) \
+            if comfort_report else None
+        show_comfort = self._show_comfort_view and comfort_key is not None
+        state_key = comfort_key if show_comfort else readings_key
+
+        # Only the main thread touches _last_state_key; the writer thread just
+        # flags that the screen contents are unknown
+        if self._resend_needed:
+            self._resend_needed = False
+            self._last_state_key = None
+
+        # Skip the I2C transfer if the frame on screen would be identical
+        if state_key == self._last_state_key:
+            return
 
         try:
-            with canvas(self.device) as draw:
-                # Draw title in the yellow section
-                title_x = 0
-                title_y = max(0, (self.yellow_section_height - self.line_height) // 2)
-
-                if self._show_comfort_view and comfort_report:
-                    draw.text((title_x, title_y), "Confort", font=self.font, fill="white")
-                else:
-                    draw.text((title_x, title_y), self.title, font=self.font, fill="white")
-
-                # Start drawing sensor data below the yellow section
-                y_pos = self.yellow_section_height
-
-                # Alternate between normal view and comfort view
-                if self._show_comfort_view and comfort_report:
-                    self._draw_comfort_view(draw, y_pos, comfort_report)
-                elif comfort_report:
-                    self._draw_normal_view(draw, y_pos, temperature, humidity, pressure,
-                                          air_quality_label, gas_resistance, air_quality_index,
-                                          comfort_report)
-                else:
-                    self._draw_fallback_view(draw, y_pos, temperature, humidity, pressure,
-                                           air_quality_label, gas_resistance, air_quality_index)
-
-        except Exception as e:
-            logger.error(f"Error updating OLED display: {e}")
+            if readings_key != self._frame_a_key:
+                self._render_readings_frame(frame_a, temperature, humidity, pressure,
+                                            aq_text, comfort_report)
+                self._frame_a_key = readings_key
 
-    def _draw_normal_view(
+            if comfort_report and comfort_key != self._frame_b_key:
+                self._render_comfort_frame(frame_b, comfort_report)
+                self._frame_b_key = comfort_key
+
+            # Toggling views only pushes the already rendered frame
+            self._submit(frame_b if show_comfort else frame_a)
+
+        except (OSError, ValueError) as e:
+            logger.error("Error updating OLED display: %s", e)
+            return
+
+        self._last_state_key = state_key
+
+    def _render_readings_frame(
         self,
-        draw,
-        y_pos: int,
+        image: Image.Image,
         temperature: float,
         humidity: float,
         pressure: float,
+        aq_text: str,
+        comfort_report: Optional[dict]
+    ) -> None:
+        """Render the normal (or fallback) readings view into image."""
+        image.paste(0, (0, 0) + image.size)
+
+        # Draw title in the yellow section
+        self._blit(image, (0, self._title_y), self.title, self.font)
+
+        # Start drawing sensor data below the yellow section
+        y_pos = self.yellow_section_height
+
+        if comfort_report:
+            self._draw_normal_view(image, y_pos, temperature, humidity, pressure, aq_text)
+        else:
+            self._draw_fallback_view(image, y_pos, temperature, humidity, pressure, aq_text)
+
+    def _render_comfort_frame(self, image: Image.Image, comfort_report: dict) -> None:
+        """Render the comfort view into image."""
+        image.paste(0, (0, 0) + image.size)
+
+        self._blit(image, (0, self._title_y), "Confort", self.font)
+        self._draw_comfort_view(image, self.yellow_section_height, comfort_report)
+
+    def _submit(self, image: Image.Image) -> None:
+        """
+        Queue a copy of image for the writer thread, replacing any unsent frame.
+
+        Args:
+            image: Full-screen 1-bit image to show
+        """
+        if self._closed:
+            return
+
+        frame = image.copy()
+        try:
+            self._flush_queue.put_nowait(frame)
+        except queue.Full:
+            # Drop the stale frame the writer has not picked up yet
+            try:
+                self._flush_queue.get_nowait()
+                self._flush_queue.task_done()
+            except queue.Empty:
+                pass
+            self._flush_queue.put_nowait(frame)
+
+    def _drain(self, timeout: float = 1.0) -> None:
+        """
+        Wait until the writer thread has sent every queued frame.
+
+        Like Queue.join() but bounded, so a stuck bus or a writer thread that
+        is already gone (e.g. at interpreter shutdown) cannot hang the caller.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        if self._writer is None:
+            return
+
+        deadline = time.monotonic() + timeout
+        with self._flush_queue.all_tasks_done:
+            while self._flush_queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Timed out waiting for OLED writer thread")
+                    return
+                self._flush_queue.all_tasks_done.wait(remaining)
+
+    def _flush_loop(self) -> None:
+        """Writer thread: send queued frames to the display."""
+        from luma.core.error import Error as LumaError
+
+        while True:
+            image = self._flush_queue.get()
+            if image is None:
+                self._flush_queue.task_done()
+                return
+            try:
+                self._flush(image)
+            except (OSError, LumaError) as e:
+                logger.error("Error updating OLED display: %s", e)
+                self._flush_failed()
+            except Exception:
+                # Keep the writer alive; a dead thread would leave update() and
+                # close() waiting on a queue nobody drains
+                logger.exception("Unexpected error in OLED writer thread")
+                self._flush_failed()
+            finally:
+                self._flush_queue.task_done()
+
+    def _flush_failed(self) -> None:
+        """Forget what is on screen after a failed flush so the next frame is resent in full."""
+        self._page_buffers = [None] * self._pages
+        self._resend_needed = True
+
+    def _flush(self, image: Image.Image) -> None:
+        """
+        Send only the framebuffer pages that changed since the last flush.
+
+        The SSD1306 stores the screen as pages of 8 pixel rows, one byte per
+        column with the top row in the least significant bit. Each page of the
+        image is packed into that layout and compared with what was last sent;
+        unchanged pages are skipped entirely, and for changed pages only the
+        column range between the first and last differing byte is sent.
+
+        Args:
+            image: Full-screen 1-bit image to show
+        """
+        device = self.device
+        if device is None:
+            return
+
+        colstart = getattr(device, "_colstart", 0)
+
+        for page in range(self._pages):
+            top = page * 8
+            strip = image.crop((0, top, self.width, top + 8))
+            # Rotating the strip turns each column into one packed byte, LSB on top
+            page_bytes = strip.transpose(Image.Transpose.ROTATE_270).tobytes()
+
+            previous = self._page_buffers[page]
+            if page_bytes == previous:
+                continue
+
+            first, last = 0, self.width - 1
+            if previous is not None:
+                while page_bytes[first] == previous[first]:
+                    first += 1
+                while page_bytes[last] == previous[last]:
+                    last -= 1
+
+            device.command(
+                _SET_COLUMN_ADDRESS, colstart + first, colstart + last,
+                _SET_PAGE_ADDRESS, page, page
+            )
+            device.data(list(page_bytes[first:last + 1]))
+            self._page_buffers[page] = page_bytes
+
+    @staticmethod
+    def _format_air_quality(
         air_quality_label: str,
         gas_resistance: Optional[float],
-        air_quality_index: Optional[int],
-        comfort_report: dict
+        air_quality_index: Optional[int]
+    ) -> str:
+        """Build the AQ line; gas resistance is only shown once air quality is known."""
+        return (
+            f"AQ: {air_quality_label}{_format_gas_kohm(int(gas_resistance + 500) // 1000)}"
+            if gas_resistance is not None and air_quality_index is not None
+            and air_quality_index > 0
+            else f"AQ: {air_quality_label}"
+        )
+
+    @staticmethod
+    def _quantize(value: float, step: float) -> float:
+        """Round value to the nearest multiple of step."""
+        return round(value / step) * step
+
+    def _blit(
+        self,
+        image: Image.Image,
+        xy: Tuple[int, int],
+        text: str,
+        font: ImageFont.FreeTypeFont
+    ) -> None:
+        """
+        Draw text onto image using a cached pre-rendered bitmap.
+
+        The first time a (font, text) pair is seen it is rasterized once into a
+        1-bit bitmap; later calls only paste that bitmap, skipping FreeType.
+
+        Args:
+            image: Target image to draw onto
+            xy: Top-left position of the text
+            text: Text to draw
+            font: Font to render the text with
+        """
+        if not text:
+            return
+
+        label = self._label_bitmaps.get(text) if font is self.font else None
+        if label is not None:
+            bitmap = label[0]
+            image.paste(bitmap, xy, bitmap)
+            return
+
+        key = (id(font), text)
+        bitmap = self._text_cache.get(key)
+
+        if bitmap is None:
+            bitmap = self._render_text(text, font)
+
+            self._text_cache[key] = bitmap
+            if len(self._text_cache) > self._TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+
+        # Use the bitmap as its own mask so only lit pixels are written
+        image.paste(bitmap, xy, bitmap)
+
+    def _blit_label(self, image: Image.Image, y_pos: int, label: str, value: str) -> None:
+        """
+        Draw a pre-rendered label followed by a dynamic value on one line.
+
+        Only the short value text goes through the text cache; the label bitmap
+        and its advance width come from _label_bitmaps.
+
+        Args:
+            image: Target image to draw onto
+            y_pos: Top of the line
+            label: Fixed label text (a key of _label_bitmaps)
+            value: Value text drawn right after the label
+        """
+        bitmap, width = self._label_bitmaps[label]
+        image.paste(bitmap, (0, y_pos), bitmap)
+        if not self._draw_text_from_atlas(image, (width, y_pos), value):
+            self._blit(image, (width, y_pos), value, self.font)
+
+    def _draw_text_from_atlas(self, image: Image.Image, xy: Tuple[int, int], text: str) -> bool:
+        """
+        Compose text from pre-rendered glyphs, without calling FreeType.
+
+        Args:
+            image: Target image to draw onto
+            xy: Top-left position of the text
+            text: Text made of _ATLAS_CHARS characters
+
+        Returns:
+            True if drawn, False if text has a character missing from the atlas
+        """
+        glyphs = self._glyph_cache
+        if not all(char in glyphs for char in text):
+            return False
+
+        x, y = xy
+        for char in text:
+            glyph, advance = glyphs[char]
+            image.paste(glyph, (x, y), glyph)
+            x += advance
+        return True
+
+    @staticmethod
+    def _render_text(text: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+        """Rasterize text into a 1-bit bitmap anchored at the text origin."""
+        _, _, right, bottom = font.getbbox(text, mode="1")
+        bitmap = Image.new("1", (max(right, 1), max(bottom, 1)))
+        ImageDraw.Draw(bitmap).text((0, 0), text, font=font, fill="white")
+        return bitmap
+
+    def _draw_normal_view(
+        self,
+        image: Image.Image,
+        y_pos: int,
+        temperature: float,
+        humidity: float,
+        pressure: float,
+        aq_text: str
     ) -> None:
         """Draw normal sensor readings view."""
+        line_height = self.line_height
+        blit_label = self._blit_label
+        blit = self._blit
+        font = self.font
+
         # Temperature with interpretation (with T: prefix)
-        temp_label = self._get_temp_short_label(temperature, comfort_report)
-        draw.text((0, y_pos), f"T: {temp_label}", font=self.font, fill="white")
-        y_pos += self.line_height
+        temp_label, temp_value = OLEDDisplay._get_temp_short_label(temperature)
+        blit_label(image, y_pos, f"T: {temp_label} ", temp_value)
+        y_pos += line_height
 
         # Humidity with interpretation (with H: prefix)
-        humid_label = self._get_humid_short_label(humidity, comfort_report)
-        draw.text((0, y_pos), f"H: {humid_label}", font=self.font, fill="white")
-        y_pos += self.line_height
+        humid_label, humid_value = OLEDDisplay._get_humid_short_label(humidity)
+        blit_label(image, y_pos, f"H: {humid_label} ", humid_value)
+        y_pos += line_height
 
         # Pressure with weather (with P: prefix)
-        press_label = self._get_pressure_short_label(pressure, comfort_report)
-        draw.text((0, y_pos), f"P: {press_label}", font=self.font, fill="white")
-        y_pos += self.line_height
+        press_label, press_value = OLEDDisplay._get_pressure_short_label(pressure)
+        blit_label(image, y_pos, f"P: {press_label} ", press_value)
+        y_pos += line_height
 
         # Air Quality
-        aq_display_text = f"AQ: {air_quality_label}"
-        if (gas_resistance is not None and
-            air_quality_index is not None and
-            air_quality_index > 0):
-            aq_display_text += f" ({gas_resistance / 1000:.0f}k)"
-        draw.text((0, y_pos), aq_display_text, font=self.font, fill="white")
-
-    def _draw_comfort_view(self, draw, y_pos: int, comfort_report: dict) -> None:
+        blit(image, (0, y_pos), aq_text, font)
+
+    def _draw_comfort_view(self, image: Image.Image, y_pos: int, comfort_report: dict) -> None:
         """Draw comfort assessment view with large emoji."""
         # Get comfort level
         comfort_level = comfort_report['overall_comfort']['level']
-        comfort_summary = comfort_report['overall_comfort']['summary']
+
+        layout = self._comfort_layout.get(comfort_level)
+        if layout is not None:
+            emoji_x, emoji_bitmap, text_x, text_bitmap = layout
+            image.paste(emoji_bitmap, (emoji_x, y_pos), emoji_bitmap)
+            image.paste(text_bitmap, (text_x, y_pos + 30), text_bitmap)
+            return
 
         # Map comfort level to emoji and English text
-        comfort_display = self._get_comfort_display(comfort_level, comfort_summary)
+        emoji, text = self._get_comfort_display(comfort_level)
 
-        # Draw large emoji (use larger font for emoji)
-        try:
-            # Try to load larger font for emoji
-            large_font = ImageFont.truetype("DejaVuSans.ttf", 28)
-        except:
-            large_font = self.font
-
-        # Center the emoji
-        emoji = comfort_display['emoji']
-        emoji_bbox = draw.textbbox((0, 0), emoji, font=large_font)
-        emoji_width = emoji_bbox[2] - emoji_bbox[0]
-        emoji_x = (self.width - emoji_width) // 2
-
-        draw.text((emoji_x, y_pos), emoji, font=large_font, fill="white")
+        # Draw large emoji centered
+        emoji_x = self._centered_x(emoji, self._large_font)
+        self._blit(image, (emoji_x, y_pos), emoji, self._large_font)
         y_pos += 30  # Space for large emoji
 
         # Draw comfort text centered
-        text = comfort_display['text']
-        text_bbox = draw.textbbox((0, 0), text, font=self.font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_x = (self.width - text_width) // 2
-
-        draw.text((text_x, y_pos), text, font=self.font, fill="white")
-
-    def _get_comfort_display(self, comfort_level: int, comfort_summary: str) -> dict:
-        """Map comfort level to emoji and English text."""
-        # ComfortLevel enum: VERY_UNCOMFORTABLE=0, UNCOMFORTABLE=1, ACCEPTABLE=2, COMFORTABLE=3, VERY_COMFORTABLE=4
-        comfort_map = {
-            4: {'emoji': '😊', 'text': 'Excellent'},      # Very Comfortable
-            3: {'emoji': '🙂', 'text': 'Good'},           # Comfortable
-            2: {'emoji': '😐', 'text': 'Acceptable'},     # Acceptable
-            1: {'emoji': '😟', 'text': 'Uncomfortable'},  # Uncomfortable
-            0: {'emoji': '😫', 'text': 'Poor'},           # Very Uncomfortable
-        }
-
-        return comfort_map.get(comfort_level, {'emoji': '❓', 'text': 'Unknown'})
+        self._blit(image, (self._centered_x(text, self.font), y_pos), text, self.font)
+
+    def _centered_x(self, text: str, font: ImageFont.FreeTypeFont) -> int:
+        """Get the x position that horizontally centers text on the display."""
+        bbox = font.getbbox(text, mode="1")
+        return int(self.width - (bbox[2] - bbox[0])) // 2
+
+    @staticmethod
+    def _get_comfort_display(comfort_level: int) -> Tuple[str, str]:
+        """Map comfort level to (emoji, English text)."""
+        if 0 <= comfort_level < len(_COMFORT_TABLE):
+            return _COMFORT_TABLE[comfort_level]
+        return _COMFORT_UNKNOWN
 
     def _draw_fallback_view(
         self,
-        draw,
+        image: Image.Image,
         y_pos: int,
         temperature: float,
         humidity: float,
         pressure: float,
-        air_quality_label: str,
-        gas_resistance: Optional[float],
-        air_quality_index: Optional[int]
+        aq_text: str
     ) -> None:
         """Draw fallback technical view when no comfort report available."""
+        line_height = self.line_height
+        blit = self._blit
+        font = self.font
+
         # Temperature
         text_line = f"T: {temperature:.1f} C"
-        draw.text((0, y_pos), text_line, font=self.font, fill="white")
-        y_pos += self.line_height
+        blit(image, (0, y_pos), text_line, font)
+        y_pos += line_height
 
         # Humidity
-        text_line = f"H: {humidity:.1f} %RH"
-        draw.text((0, y_pos), text_line, font=self.font, fill="white")
-        y_pos += self.line_height
+        text_line = f"H: {humidity:.0f} %RH"
+        blit(image, (0, y_pos), text_line, font)
+        y_pos += line_height
 
         # Pressure
-        text_line = f"P: {pressure:.1f} hPa"
-        draw.text((0, y_pos), text_line, font=self.font, fill="white")
-        y_pos += self.line_height
+        text_line = f"P: {pressure:.0f} hPa"
+        blit(image, (0, y_pos), text_line, font)
+        y_pos += line_height
 
         # Air Quality
-        aq_display_text = f"AQ: {air_quality_label}"
-        if (gas_resistance is not None and
-            air_quality_index is not None and
-            air_quality_index > 0):
-            aq_display_text += f" ({gas_resistance / 1000:.0f}k)"
-        draw.text((0, y_pos), aq_display_text, font=self.font, fill="white")
+        blit(image, (0, y_pos), aq_text, font)
 
     def _shorten_recommendation(self, recommendation: str) -> str:
         """Shorten recommendation text to fit OLED display."""
         # Remove emoji and leading symbols
-        text = recommendation
-        for emoji in ['✓', '⚠️', '❌', '🥶', '❄️', '🌡️', '🔥', '💧', '💨', '☁️', '⛅', '☀️', '🌧️', '🌤️']:
-            text = text.replace(emoji, '').strip()
+        text = _EMOJI_RE.sub('', recommendation).strip()
 
         # Truncate if too long (max ~21 chars for 128px width)
         if len(text) > 21:
@@ -287,52 +787,28 @@ class OLEDDisplay:
 
         return text
 
-    def _get_temp_short_label(self, temperature: float, comfort_report: dict) -> str:
-        """Get short temperature label for OLED display."""
-        if temperature < 10:
-            return f"Very Cold {temperature:.1f}C"
-        elif temperature < 18:
-            return f"Cold {temperature:.1f}C"
-        elif temperature <= 24:
-            return f"Perfect {temperature:.1f}C"
-        elif temperature <= 28:
-            return f"Warm {temperature:.1f}C"
-        else:
-            return f"Very Hot {temperature:.1f}C"
-
-    def _get_humid_short_label(self, humidity: float, comfort_report: dict) -> str:
-        """Get short humidity label for OLED display."""
-        if humidity < 30:
-            return f"Very Dry {humidity:.0f}%"
-        elif humidity < 40:
-            return f"Dry {humidity:.0f}%"
-        elif humidity <= 60:
-            return f"Ideal {humidity:.0f}%"
-        elif humidity <= 70:
-            return f"Humid {humidity:.0f}%"
-        else:
-            return f"Very Humid {humidity:.0f}%"
-
-    def _get_pressure_short_label(self, pressure: float, comfort_report: dict) -> str:
-        """Get short pressure label for OLED display."""
-        if pressure < 980:
-            return f"Storm {pressure:.0f}"
-        elif pressure < 1000:
-            return f"Rainy {pressure:.0f}"
-        elif pressure <= 1025:
-            return f"Normal {pressure:.0f}"
-        elif pressure <= 1035:
-            return f"Clear {pressure:.0f}"
-        else:
-            return f"Very Dry {pressure:.0f}"
+    @staticmethod
+    def _get_temp_short_label(temperature: float) -> Tuple[str, str]:
+        """Get short temperature (label, value) pair for OLED display."""
+        return (_TEMP_LABELS[bisect_right(TEMP_EDGES, temperature)], f"{temperature:.1f}C")
+
+    @staticmethod
+    def _get_humid_short_label(humidity: float) -> Tuple[str, str]:
+        """Get short humidity (label, value) pair for OLED display."""
+        return (_HUMID_LABELS[bisect_right(HUMID_EDGES, humidity)], f"{humidity:.0f}%")
+
+    @staticmethod
+    def _get_pressure_short_label(pressure: float) -> Tuple[str, str]:
+        """Get short pressure (label, value) pair for OLED display."""
+        return (_PRESSURE_LABELS[bisect_right(PRESSURE_EDGES, pressure)], f"{pressure:.0f}")
 
     def clear(self) -> None:
         """Clear the OLED display."""
         if self.enabled and self.device:
-            try:
-                self.device.clear()
-            except Exception as e:
-                logger.error(f"Error clearing OLED display: {e}")
+            self._last_state_key = None
+            # Goes through the writer thread so it never races a pending frame
+            self._submit(Image.new("1", self.device.size))
+            self._drain()
 
     def show_message(self, message: str, line: int = 0) -> None:
         """
@@ -342,15 +818,19 @@ class OLEDDisplay:
             message: Message text to display
             line: Line number (0-based) to display message on
         """
-        if not self.enabled or not self.device or not self.font:
+        image = self._message_frame
+        if not self.enabled or not self.device or not self.font or image is None:
             return
 
+        self._last_state_key = None
+
         try:
-            with canvas(self.device) as draw:
-                y_pos = line * self.line_height
-                draw.text((0, y_pos), message, font=self.font, fill="white")
-        except Exception as e:
-            logger.error(f"Error showing message on OLED: {e}")
+            image.paste(0, (0, 0) + image.size)
+            y_pos = line * self.line_height
+            self._blit(image, (0, y_pos), message, self.font)
+            self._submit(image)
+        except (OSError, ValueError) as e:
+            logger.error("Error showing message on OLED: %s", e)
 
     def is_available(self) -> bool:
         """
@@ -361,10 +841,32 @@ class OLEDDisplay:
         """
         return self.enabled and self.device is not None
 
-    def __del__(self):
-        """Cleanup OLED display on deletion."""
-        if self.device:
+    def close(self) -> None:
+        """
+        Clear the display and stop the writer thread.
+
+        Safe to call more than once; also registered with atexit.
+        """
+        if self._closed:
+            return
+        atexit.unregister(self.close)
+
+        if self.is_available():
+            self.clear()
+        self._closed = True
+
+        if self._writer is not None:
             try:
-                self.clear()
-            except:
+                self._flush_queue.put(None, timeout=1.0)
+            except queue.Full:
                 pass
+            self._writer.join(timeout=1.0)
+            if self._writer.is_alive():
+                logger.warning("OLED writer thread did not stop")
+            self._writer = None
+
+    def __enter__(self) -> "OLEDDisplay":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,57 +1,50 @@
 """BME680 sensor management and data acquisition."""
 
+from __future__ import annotations
+
 import logging
-import bme680
-from typing import Optional, Dict, Any
+import math
+from array import array
+from typing import TYPE_CHECKING, Optional, Dict, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import bme680
+    from smbus2 import SMBus
 
 
 logger = logging.getLogger(__name__)
 
 
-class SensorData:
-    """Container for sensor reading data."""
+class SensorData(NamedTuple):
+    """
+    Container for sensor reading data.
 
-    def __init__(
-        self,
-        temperature: float,
-        humidity: float,
-        pressure: float,
-        gas_resistance: Optional[float],
-        heat_stable: bool
-    ):
-        """
-        Initialize sensor data.
+    Attributes:
+        temperature: Temperature in Celsius
+        humidity: Relative humidity in %
+        pressure: Atmospheric pressure in hPa
+        gas_resistance: Gas resistance in Ohms (None if not stable)
+        heat_stable: Whether gas sensor heater is stable
+    """
 
-        Args:
-            temperature: Temperature in Celsius
-            humidity: Relative humidity in %
-            pressure: Atmospheric pressure in hPa
-            gas_resistance: Gas resistance in Ohms (None if not stable)
-            heat_stable: Whether gas sensor heater is stable
-        """
-        self.temperature = temperature
-        self.humidity = humidity
-        self.pressure = pressure
-        self.gas_resistance = gas_resistance
-        self.heat_stable = heat_stable
+    temperature: float
+    humidity: float
+    pressure: float
+    gas_resistance: Optional[float]
+    heat_stable: bool
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert sensor data to dictionary."""
-        return {
-            'temperature': self.temperature,
-            'humidity': self.humidity,
-            'pressure': self.pressure,
-            'gas_resistance': self.gas_resistance,
-            'heat_stable': self.heat_stable
-        }
+        return self._asdict()
 
     def __repr__(self) -> str:
         """String representation of sensor data."""
+        gas = f"{self.gas_resistance:.0f}" if self.gas_resistance is not None else "N/A"
         return (
             f"SensorData(T={self.temperature:.1f}°C, "
             f"H={self.humidity:.1f}%, "
             f"P={self.pressure:.1f}hPa, "
-            f"Gas={self.gas_resistance:.0f if self.gas_resistance else 'N/A'}Ω)"
+            f"Gas={gas}Ω)"
         )
 
 
@@ -62,7 +55,8 @@ class SensorManager:
         self,
         i2c_address: int = 0x77,
         gas_heater_temperature: int = 320,
-        gas_heater_duration: int = 150
+        gas_heater_duration: int = 150,
+        bus: Optional[SMBus] = None
     ):
         """
         Initialize sensor manager.
@@ -71,6 +65,8 @@ class SensorManager:
             i2c_address: I2C address of BME680 sensor (0x77 or 0x76)
             gas_heater_temperature: Gas heater temperature in Celsius
             gas_heater_duration: Gas heater duration in milliseconds
+            bus: Open I2C bus to share with other devices; if None the
+                bme680 library opens its own
 
         Raises:
             RuntimeError: If sensor initialization fails
@@ -78,18 +74,23 @@ class SensorManager:
         self.i2c_address = i2c_address
         self.gas_heater_temperature = gas_heater_temperature
         self.gas_heater_duration = gas_heater_duration
+        self._bus = bus
 
         self.sensor: Optional[bme680.BME680] = None
+        self._gas_enabled = True
         self._initialize_sensor()
 
     def _initialize_sensor(self) -> None:
         """Initialize BME680 sensor and configure settings."""
+        # Imported here so the package can be imported without the driver
+        import bme680
+
         try:
-            self.sensor = bme680.BME680(self.i2c_address)
-            logger.info(f"BME680 sensor detected at address 0x{self.i2c_address:02X}")
+            self.sensor = bme680.BME680(self.i2c_address, i2c_device=self._bus)
+            logger.info("BME680 sensor detected at address 0x%02X", self.i2c_address)
 
         except RuntimeError as e:
-            logger.error(f"Error initializing sensor: {e}")
+            logger.error("Error initializing sensor: %s", e)
             logger.error("Ensure SDA and SCL connections are correct")
             logger.error("and that I2C is enabled (sudo raspi-config -> Interface Options -> I2C)")
             raise
@@ -100,8 +101,8 @@ class SensorManager:
         self.sensor.select_gas_heater_profile(0)
 
         logger.info(
-            f"Gas heater configured: {self.gas_heater_temperature}°C, "
-            f"{self.gas_heater_duration}ms"
+            "Gas heater configured: %s°C, %sms",
+            self.gas_heater_temperature, self.gas_heater_duration
         )
 
         # Optional: Configure oversampling (commented out - using defaults)
@@ -114,6 +115,8 @@ class SensorManager:
         """
         Read sensor data.
 
+        Gas measurement is re-enabled first if read_tph_only() turned it off.
+
         Returns:
             SensorData object if successful, None otherwise
         """
@@ -122,6 +125,7 @@ class SensorManager:
             return None
 
         try:
+            self._set_gas_enabled(True)
             if self.sensor.get_sensor_data():
                 temperature = self.sensor.data.temperature
                 humidity = self.sensor.data.humidity
@@ -141,11 +145,138 @@ class SensorManager:
                     heat_stable=heat_stable
                 )
 
-        except Exception as e:
-            logger.error(f"Error reading sensor data: {e}")
+        except (OSError, RuntimeError) as e:
+            logger.error("Error reading sensor data: %s", e)
 
         return None
 
+    async def read_async(self) -> Optional[SensorData]:
+        """
+        Read sensor data without blocking the event loop.
+
+        The blocking I2C conversion runs in the loop's default executor, so
+        other tasks keep running while the sensor measures.
+
+        Returns:
+            SensorData object if successful, None otherwise
+        """
+        # Imported here so synchronous callers don't pay for asyncio
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read)
+
+    def read_tph_only(self) -> Optional[SensorData]:
+        """
+        Read temperature, humidity and pressure with gas measurement disabled.
+
+        Skipping the heater cycle shortens each conversion considerably. The
+        gas measurement stays disabled until the next read(), read_with_gas()
+        or read_batch() call.
+
+        The monitor loop in sensor.py does not use this, not even during
+        burn-in: burn-in exists to bring the heater plate to temperature, and
+        the air quality baseline that follows needs the heater running. It is
+        meant for callers that only need temperature, humidity and pressure.
+
+        Returns:
+            SensorData object (without gas resistance) if successful, None otherwise
+        """
+        if not self.sensor:
+            logger.error("Sensor not initialized")
+            return None
+
+        try:
+            self._set_gas_enabled(False)
+            if self.sensor.get_sensor_data():
+                data = self.sensor.data
+                return SensorData(
+                    temperature=data.temperature,
+                    humidity=data.humidity,
+                    pressure=data.pressure,
+                    gas_resistance=None,
+                    heat_stable=False
+                )
+
+        except (OSError, RuntimeError) as e:
+            logger.error("Error reading sensor data: %s", e)
+
+        return None
+
+    def read_with_gas(self) -> Optional[SensorData]:
+        """
+        Read sensor data with gas measurement; the counterpart of read_tph_only().
+
+        Equivalent to read(), which also re-enables gas measurement.
+
+        Returns:
+            SensorData object if successful, None otherwise
+        """
+        return self.read()
+
+    def _set_gas_enabled(self, enabled: bool) -> None:
+        """Switch the gas measurement on or off, skipping redundant register writes."""
+        if self.sensor is None or enabled == self._gas_enabled:
+            return
+
+        import bme680
+        self.sensor.set_gas_status(bme680.ENABLE_GAS_MEAS if enabled else bme680.DISABLE_GAS_MEAS)
+        self._gas_enabled = enabled
+
+    def read_batch(self, n: int) -> Dict[str, array]:
+        """
+        Read up to n samples into parallel per-field arrays.
+
+        Unlike read(), no SensorData object is created per sample; each field
+        is appended to a typed array, so downstream statistics can work on
+        whole columns. Failed reads are skipped, so fewer than n samples may
+        be returned.
+
+        Args:
+            n: Number of readings to take
+
+        Returns:
+            Dictionary mapping each SensorData field name to an array of
+            samples. Gas resistance is NaN where the heater was not stable
+            and heat_stable holds 0/1 flags.
+        """
+        batch: Dict[str, array] = {
+            'temperature': array('d'),
+            'humidity': array('d'),
+            'pressure': array('d'),
+            'gas_resistance': array('d'),
+            'heat_stable': array('b'),
+        }
+
+        if not self.sensor:
+            logger.error("Sensor not initialized")
+            return batch
+
+        sensor = self.sensor
+        data = sensor.data
+        temperature = batch['temperature'].append
+        humidity = batch['humidity'].append
+        pressure = batch['pressure'].append
+        gas_resistance = batch['gas_resistance'].append
+        heat_stable = batch['heat_stable'].append
+
+        try:
+            self._set_gas_enabled(True)
+            for _ in range(n):
+                if not sensor.get_sensor_data():
+                    continue
+                stable = data.heat_stable
+                temperature(data.temperature)
+                humidity(data.humidity)
+                pressure(data.pressure)
+                gas_resistance(data.gas_resistance if stable else math.nan)
+                heat_stable(1 if stable else 0)
+
+        except (OSError, RuntimeError) as e:
+            logger.error("Error reading sensor data: %s", e)
+
+        return batch
+
     def is_available(self) -> bool:
         """
         Check if sensor is available and working.
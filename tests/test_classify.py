@@ -0,0 +1,90 @@
+"""Tests for reading classification module."""
+
+from array import array
+import math
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bme680_monitor.classify import (
+    HUMID_EDGES,
+    PRESSURE_EDGES,
+    TEMP_EDGES,
+    _classify_kernel,
+    classify_temperature,
+    classify_humidity,
+    classify_pressure,
+)
+
+
+class Vector(list):
+    """List with the .shape the kernel reads, so it can run as plain Python."""
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+
+# Boundary values for each set of edges, plus NaN
+KERNEL_CASES = [
+    (TEMP_EDGES, classify_temperature,
+     [5.0, 10.0, 17.9, 18.0, 24.0, 24.1, 28.0, 28.1, math.nan]),
+    (HUMID_EDGES, classify_humidity,
+     [20.0, 30.0, 40.0, 60.0, 61.0, 70.0, 71.0, math.nan]),
+    (PRESSURE_EDGES, classify_pressure,
+     [975.0, 980.0, 1000.0, 1025.0, 1030.0, 1035.0, 1040.0, math.nan]),
+]
+
+
+class TestClassify:
+    """Test suite for batch classification helpers."""
+
+    def test_temperature_levels(self):
+        """Test temperature boundaries, upper bounds inclusive."""
+        levels = classify_temperature([5.0, 10.0, 17.9, 18.0, 24.0, 24.1, 28.0, 28.1])
+        assert list(levels) == [0, 1, 1, 2, 2, 3, 3, 4]
+
+    def test_humidity_levels(self):
+        """Test humidity boundaries, upper bounds inclusive."""
+        levels = classify_humidity([20.0, 30.0, 40.0, 60.0, 61.0, 70.0, 71.0])
+        assert list(levels) == [0, 1, 2, 2, 3, 3, 4]
+
+    def test_pressure_levels(self):
+        """Test pressure boundaries, upper bounds inclusive."""
+        levels = classify_pressure([975.0, 980.0, 1000.0, 1025.0, 1030.0, 1035.0, 1040.0])
+        assert list(levels) == [0, 1, 2, 2, 3, 3, 4]
+
+    def test_quantized_value_on_boundary(self):
+        """Test float error from quantization does not move a value up a level."""
+        assert list(classify_temperature([round(24.0 / 0.2) * 0.2])) == [2]
+
+    def test_empty_input(self):
+        """Test classifying no readings returns an empty result."""
+        assert len(classify_temperature([])) == 0
+
+    def test_nan_is_level_zero(self):
+        """Test a missing reading gets level 0."""
+        assert list(classify_temperature([math.nan, 20.0])) == [0, 2]
+
+    @pytest.mark.parametrize("edges,classify,values", KERNEL_CASES)
+    def test_kernel_matches_fallback(self, edges, classify, values):
+        """Test the kernel, run as plain Python, agrees with the bisect fallback."""
+        out = array('b', bytes(len(values)))
+        _classify_kernel(Vector(values), Vector(edges), out)
+
+        assert list(out) == list(classify(values))
+
+    @pytest.mark.parametrize("edges,classify,values", KERNEL_CASES)
+    def test_compiled_kernel_matches_fallback(self, edges, classify, values):
+        """Test NumPy input through the numba kernel agrees with the bisect fallback."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("numba")
+
+        levels = classify(np.array(values))
+
+        assert levels.dtype == np.int8
+        assert levels.tolist() == list(classify(values))
@@ -0,0 +1,48 @@
+"""Tests for comfort index module."""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bme680_monitor.comfort_index import ComfortIndexCalculator
+
+
+def fahrenheit_to_celsius(value: float) -> float:
+    """Convert a Fahrenheit temperature to Celsius."""
+    return (value - 32) * 5 / 9
+
+
+class TestComfortIndexCalculator:
+    """Test suite for ComfortIndexCalculator."""
+
+    @pytest.fixture
+    def calculator(self):
+        """Create a test comfort index calculator."""
+        return ComfortIndexCalculator()
+
+    @pytest.mark.parametrize("temp_f, humidity, expected_f", [
+        (90, 70, 106),   # NWS heat index table
+        (100, 40, 109),
+        (86, 90, 105),
+    ])
+    def test_heat_index_matches_nws_table(self, calculator, temp_f, humidity, expected_f):
+        """Test heat index against the NWS heat index chart."""
+        heat_index, _ = calculator.calculate_heat_index(fahrenheit_to_celsius(temp_f), humidity)
+
+        # Chart values are rounded to whole degrees Fahrenheit
+        assert heat_index == pytest.approx(fahrenheit_to_celsius(expected_f), abs=0.5)
+
+    def test_heat_index_regression(self, calculator):
+        """Test the Rothfusz terms keep their signs (previously ~-666 °C here)."""
+        heat_index, _ = calculator.calculate_heat_index(32.0, 70.0)
+
+        assert heat_index == pytest.approx(40.4, abs=0.1)
+
+    def test_heat_index_not_applicable_below_27c(self, calculator):
+        """Test heat index returns the temperature itself when it does not apply."""
+        heat_index, _ = calculator.calculate_heat_index(20.0, 50.0)
+
+        assert heat_index == 20.0
@@ -1,7 +1,7 @@
 """Tests for configuration module."""
 
+import io
 import pytest
-import tempfile
 import yaml
 from pathlib import Path
 import sys
@@ -16,9 +16,9 @@ class TestConfig:
     """Test suite for Config."""
 
     @pytest.fixture
-    def temp_config_file(self):
-        """Create a temporary config file."""
-        config_data = {
+    def config_data(self):
+        """Sample configuration data."""
+        return {
             'sensor': {
                 'i2c_address': 0x77,
                 'gas_heater_temperature': 320,
@@ -41,43 +41,34 @@ class TestConfig:
             }
         }
 
-        fd, path = tempfile.mkstemp(suffix='.yaml')
-        with open(path, 'w') as f:
-            yaml.dump(config_data, f)
-
-        yield path
-
-        # Cleanup
-        import os
-        os.close(fd)
-        os.remove(path)
+    @pytest.fixture
+    def config(self, config_data):
+        """Create a config from an in-memory YAML stream."""
+        return Config.from_stream(io.StringIO(yaml.dump(config_data)))
 
-    def test_load_config(self, temp_config_file):
+    def test_load_config(self, config_data, tmp_path):
         """Test loading configuration from file."""
-        config = Config(temp_config_file)
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.dump(config_data))
+
+        config = Config(str(path))
 
         assert config.sensor_i2c_address == 0x77
         assert config.gas_heater_temperature == 320
         assert config.sampling_interval == 1
 
-    def test_get_with_dot_notation(self, temp_config_file):
+    def test_get_with_dot_notation(self, config):
         """Test getting values with dot notation."""
-        config = Config(temp_config_file)
-
         assert config.get('sensor.i2c_address') == 0x77
         assert config.get('calibration.burn_in_duration') == 300
         assert config.get('air_quality.good_threshold') == 1.35
 
-    def test_get_with_default(self, temp_config_file):
+    def test_get_with_default(self, config):
         """Test getting non-existent value returns default."""
-        config = Config(temp_config_file)
-
         assert config.get('nonexistent.key', 'default') == 'default'
 
-    def test_properties(self, temp_config_file):
+    def test_properties(self, config):
         """Test configuration properties."""
-        config = Config(temp_config_file)
-
         # Sensor properties
         assert config.sensor_i2c_address == 0x77
         assert config.gas_heater_temperature == 320
@@ -101,3 +92,12 @@ class TestConfig:
         """Test error when config file doesn't exist."""
         with pytest.raises(FileNotFoundError):
             Config('nonexistent.yaml')
+
+    def test_schema_attribute_defaults_and_caching(self, config):
+        """Test schema attributes fall back to defaults and are cached."""
+        # Not present in the file, resolved from the schema default
+        assert config.oled_title == 'BME680 Readings'
+        assert 'oled_title' in config.__dict__
+
+        with pytest.raises(AttributeError):
+            config.nonexistent_attribute
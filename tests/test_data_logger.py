@@ -118,3 +118,9 @@ class TestDataLogger:
         with open(temp_csv_file, 'r') as f:
             lines = f.readlines()
             assert len(lines) == 3  # Header + 2 readings
+
+        # Numeric fields are written with two decimals
+        with open(temp_csv_file, 'r') as f:
+            rows = list(csv.reader(f))
+            assert rows[1][1:] == ['25.00', '60.00', '1013.00', '100000.00', '3', 'Good']
+            assert rows[2][1:] == ['26.00', '55.00', '1012.00', '95000.00', '2', 'Moderate']
@@ -0,0 +1,164 @@
+"""Tests for OLED display module."""
+
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("luma.oled")
+
+from bme680_monitor.display import OLEDDisplay
+
+
+class FakeBus:
+    """
+    Stand-in for a shared smbus2.SMBus that records every transfer.
+
+    i2c_rdwr messages are also applied to an emulated SSD1306 GDDRAM
+    (horizontal addressing mode), so tests can compare what the display
+    would show with the frame that was rendered.
+    """
+
+    def __init__(self, width=128, pages=8):
+        self.rdwr_addresses = []
+        self.smbus_calls = []
+        self.data_bytes = 0
+        # Exception to raise from the next i2c_rdwr call
+        self.fail_with = None
+
+        self.width = width
+        self.pages = pages
+        self.ram = bytearray(width * pages)
+        self.columns = (0, width - 1)
+        self.page_range = (0, pages - 1)
+        self.pointer = (0, 0)
+
+    def i2c_rdwr(self, *messages):
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+        for message in messages:
+            self.rdwr_addresses.append(message.addr)
+            control, *payload = list(message)
+            if control == 0x00:
+                self._command(payload)
+            else:
+                self._data(payload)
+
+    def write_i2c_block_data(self, address, register, data):
+        # Relies on the file descriptor's cached I2C_SLAVE address
+        self.smbus_calls.append(address)
+
+    def close(self):
+        pass
+
+    def _command(self, payload):
+        i = 0
+        while i < len(payload):
+            if payload[i] == 0x21:  # Set column address
+                self.columns = (payload[i + 1], payload[i + 2])
+                i += 3
+            elif payload[i] == 0x22:  # Set page address
+                self.page_range = (payload[i + 1], payload[i + 2])
+                i += 3
+            else:
+                i += 1
+                continue
+            self.pointer = (self.columns[0], self.page_range[0])
+
+    def _data(self, payload):
+        column, page = self.pointer
+        for byte in payload:
+            self.ram[page * self.width + column] = byte
+            self.data_bytes += 1
+            column += 1
+            if column > self.columns[1]:
+                column = self.columns[0]
+                page = page + 1 if page < self.page_range[1] else self.page_range[0]
+        self.pointer = (column, page)
+
+    def image(self):
+        """Return the emulated GDDRAM contents as a 1-bit image."""
+        image = Image.new("1", (self.width, self.pages * 8))
+        pixels = image.load()
+        for page in range(self.pages):
+            for x in range(self.width):
+                byte = self.ram[page * self.width + x]
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        pixels[x, page * 8 + bit] = 255
+        return image
+
+
+class TestOLEDDisplay:
+    """Test suite for OLEDDisplay."""
+
+    @pytest.fixture
+    def bus(self):
+        """Create a fake shared I2C bus."""
+        return FakeBus()
+
+    @pytest.fixture
+    def display(self, bus):
+        """Create a display on the fake bus."""
+        display = OLEDDisplay(bus=bus, i2c_address=0x3C)
+        assert display.is_available()
+        yield display
+        display.close()
+
+    def test_shared_bus_transfers_carry_display_address(self, display, bus):
+        """Test every display transfer addresses the OLED without touching the fd address."""
+        display.update(22.0, 45.0, 1013.0, "Good", 120000.0, 3)
+        display.show_message("Hello", 2)
+        display.clear()
+
+        assert bus.rdwr_addresses
+        assert set(bus.rdwr_addresses) == {0x3C}
+        assert bus.smbus_calls == []
+
+    def test_flush_matches_rendered_frame(self, display, bus):
+        """Test the GDDRAM holds exactly the rendered frame, including partial updates."""
+        display.update(22.0, 45.0, 1013.0, "Good", 120000.0, 3)
+        display._drain()
+        assert bus.image().tobytes() == display._frame_a.tobytes()
+
+        # A one-digit change only sends the changed column window
+        sent = bus.data_bytes
+        display.update(22.4, 45.0, 1013.0, "Good", 120000.0, 3)
+        display._drain()
+        assert bus.image().tobytes() == display._frame_a.tobytes()
+        assert 0 < bus.data_bytes - sent < 128
+
+    @pytest.mark.parametrize("error", [OSError("bus error"), RuntimeError("unexpected")])
+    def test_failed_flush_is_resent(self, display, bus, error):
+        """Test the writer survives a failed flush and the same frame is sent again."""
+        display.update(22.0, 45.0, 1013.0, "Good", 120000.0, 3)
+        display._drain()
+
+        bus.fail_with = error
+        display.update(22.4, 45.0, 1013.0, "Good", 120000.0, 3)
+        display._drain()
+        assert display._writer.is_alive()
+
+        # Unchanged readings are not skipped, since the screen contents are unknown
+        display.update(22.4, 45.0, 1013.0, "Good", 120000.0, 3)
+        display._drain()
+        assert bus.image().tobytes() == display._frame_a.tobytes()
+
+    def test_flush_uses_configured_geometry(self):
+        """Test a 128x32 panel is driven and flushed at its configured size."""
+        bus = FakeBus(pages=4)
+        display = OLEDDisplay(bus=bus, height=32)
+        try:
+            display.update(22.0, 45.0, 1013.0, "Good", 120000.0, 3)
+            display._drain()
+
+            assert display.device.size == (128, 32)
+            assert display._frame_a.size == (128, 32)
+            assert bus.image().tobytes() == display._frame_a.tobytes()
+        finally:
+            display.close()
@@ -0,0 +1,156 @@
+"""Tests for sensor manager module."""
+
+import asyncio
+import math
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bme680_monitor.sensor_manager import SensorData, SensorManager
+
+
+class FakeSensor:
+    """Stand-in for bme680.BME680 that replays a list of readings."""
+
+    def __init__(self, i2c_addr, i2c_device=None):
+        self.data = SimpleNamespace(
+            temperature=0.0, humidity=0.0, pressure=0.0,
+            gas_resistance=0.0, heat_stable=False
+        )
+        # Each reading is a (temperature, humidity, pressure, gas, heat_stable)
+        # tuple, or None for a conversion that is not ready
+        self.readings = []
+        self.gas_status_writes = []
+
+    def set_gas_heater_temperature(self, value):
+        pass
+
+    def set_gas_heater_duration(self, value):
+        pass
+
+    def select_gas_heater_profile(self, value):
+        pass
+
+    def set_gas_status(self, value):
+        self.gas_status_writes.append(value)
+
+    def get_sensor_data(self):
+        reading = self.readings.pop(0)
+        if reading is None:
+            return False
+        (self.data.temperature, self.data.humidity, self.data.pressure,
+         self.data.gas_resistance, self.data.heat_stable) = reading
+        return True
+
+
+class TestSensorData:
+    """Test suite for SensorData."""
+
+    def test_repr_with_gas(self):
+        """Test repr formats gas resistance in whole Ohms."""
+        data = SensorData(21.04, 40.0, 1013.25, 51234.6, True)
+
+        assert repr(data) == "SensorData(T=21.0°C, H=40.0%, P=1013.2hPa, Gas=51235Ω)"
+
+    def test_repr_with_zero_gas(self):
+        """Test repr shows a zero gas resistance rather than N/A."""
+        data = SensorData(21.0, 40.0, 1013.0, 0.0, True)
+
+        assert repr(data).endswith("Gas=0Ω)")
+
+    def test_repr_without_gas(self):
+        """Test repr shows N/A when gas resistance is not available."""
+        data = SensorData(21.0, 40.0, 1013.0, None, False)
+
+        assert repr(data).endswith("Gas=N/AΩ)")
+
+    def test_to_dict(self):
+        """Test conversion to a plain dictionary."""
+        data = SensorData(21.0, 40.0, 1013.0, None, False)
+
+        assert data.to_dict() == {
+            'temperature': 21.0,
+            'humidity': 40.0,
+            'pressure': 1013.0,
+            'gas_resistance': None,
+            'heat_stable': False
+        }
+
+
+class TestSensorManager:
+    """Test suite for SensorManager."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Create a sensor manager backed by a fake sensor."""
+        bme680 = pytest.importorskip("bme680")
+        monkeypatch.setattr(bme680, "BME680", FakeSensor)
+        return SensorManager()
+
+    def test_read_async(self, manager):
+        """Test read_async returns the same data as read()."""
+        manager.sensor.readings = [(21.0, 40.0, 1013.0, 50000.0, True)]
+
+        data = asyncio.run(manager.read_async())
+
+        assert data == SensorData(21.0, 40.0, 1013.0, 50000.0, True)
+
+    def test_read_batch(self, manager):
+        """Test read_batch skips failed reads and fills NaN gas while unstable."""
+        manager.sensor.readings = [
+            (21.0, 40.0, 1013.0, 50000.0, True),
+            None,
+            (21.5, 41.0, 1012.0, 12345.0, False),
+        ]
+
+        batch = manager.read_batch(3)
+
+        assert list(batch['temperature']) == [21.0, 21.5]
+        assert list(batch['humidity']) == [40.0, 41.0]
+        assert list(batch['pressure']) == [1013.0, 1012.0]
+        assert batch['gas_resistance'][0] == 50000.0
+        assert math.isnan(batch['gas_resistance'][1])
+        assert list(batch['heat_stable']) == [1, 0]
+
+    def test_read_tph_only_disables_gas_once(self, manager):
+        """Test the gas register is written only when the gas state changes."""
+        manager.sensor.readings = [
+            (21.0, 40.0, 1013.0, 50000.0, True),
+            (21.0, 40.0, 1013.0, 50000.0, True),
+        ]
+
+        first = manager.read_tph_only()
+        second = manager.read_tph_only()
+
+        assert manager.sensor.gas_status_writes == [0]
+        assert first == second == SensorData(21.0, 40.0, 1013.0, None, False)
+
+    def test_read_restores_gas(self, manager):
+        """Test read() and read_with_gas() re-enable gas after read_tph_only()."""
+        manager.sensor.readings = [
+            (21.0, 40.0, 1013.0, 50000.0, True),
+            (21.0, 40.0, 1013.0, 50000.0, True),
+            (21.0, 40.0, 1013.0, 50000.0, True),
+            (21.0, 40.0, 1013.0, 50000.0, True),
+        ]
+
+        manager.read_tph_only()
+        data = manager.read()
+        manager.read_tph_only()
+        manager.read_with_gas()
+
+        assert manager.sensor.gas_status_writes == [0, -1, 0, -1]
+        assert data.gas_resistance == 50000.0
+
+    def test_read_without_tph_only_leaves_gas_register(self, manager):
+        """Test plain reads never write the gas register."""
+        manager.sensor.readings = [(21.0, 40.0, 1013.0, 50000.0, True)]
+
+        manager.read()
+
+        assert manager.sensor.gas_status_writes == []